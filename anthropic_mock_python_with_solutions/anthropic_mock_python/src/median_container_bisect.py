@@ -1,24 +1,30 @@
 """
 Reference solution (bisect-based): simpler, correctness-first.
+Backed by sortedcontainers.SortedList, which keeps values in sqrt(n)-sized
+sorted sublists so an insert/delete only shifts one small sublist.
 Time:
-- add/remove: O(n) due to list shifts
-- median: O(1)
+- add/remove: O(log n)
+- median: O(log n) indexed access
 """
-from typing import List
-import bisect
+from typing import Iterable
+
+from sortedcontainers import SortedList
 
 class MedianContainer:
     def __init__(self) -> None:
-        self._a: List[int] = []
+        self._a = SortedList()
 
     def add(self, x: int) -> None:
-        bisect.insort(self._a, x)
+        self._a.add(x)
+
+    def add_many(self, xs: Iterable[int]) -> None:
+        self._a.update(xs)
 
     def remove(self, x: int) -> bool:
-        i = bisect.bisect_left(self._a, x)
+        i = self._a.bisect_left(x)
         if i == len(self._a) or self._a[i] != x:
             return False
-        self._a.pop(i)
+        del self._a[i]
         return True
 
     def median(self) -> int:
@@ -0,0 +1,61 @@
+"""
+Reference solution (Fenwick tree over a coordinate-compressed value domain).
+Suited to offline workloads where the set of values is known up front:
+pass it as `keys`; memory is O(K) for K distinct keys regardless of their span.
+Time:
+- add/remove: O(log K)
+- median: O(log K) single descent, no lazy deletion
+Behavior:
+- add() of a value outside `keys` raises ValueError; remove() returns False.
+"""
+from typing import Iterable, List
+
+class MedianContainer:
+    def __init__(self, keys: Iterable[int]) -> None:
+        self._vals: List[int] = sorted(set(keys))              # slot -> value
+        self._idx = {v: i for i, v in enumerate(self._vals)}   # value -> slot
+        self._size = len(self._vals)
+        self._cnt: List[int] = [0] * self._size        # multiplicity per slot
+        self._bit: List[int] = [0] * (self._size + 1)  # 1-based Fenwick tree over _cnt
+        self.n = 0
+
+    # Helpers
+    def _update(self, i: int, d: int) -> None:
+        bit, size = self._bit, self._size
+        i += 1
+        while i <= size:
+            bit[i] += d
+            i += i & -i
+
+    def add(self, x: int) -> None:
+        i = self._idx.get(x)
+        if i is None:
+            raise ValueError(f"{x} is not in the key universe")
+        self._cnt[i] += 1
+        self._update(i, 1)
+        self.n += 1
+
+    def remove(self, x: int) -> bool:
+        i = self._idx.get(x)
+        if i is None or self._cnt[i] == 0:
+            return False
+        self._cnt[i] -= 1
+        self._update(i, -1)
+        self.n -= 1
+        return True
+
+    def median(self) -> int:
+        if self.n == 0:
+            raise ValueError("empty")
+        # lower median is the ((n+1)//2)-th smallest; descend by powers of two
+        k = (self.n + 1) // 2
+        bit, size = self._bit, self._size
+        pos = 0
+        step = 1 << size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= size and bit[nxt] < k:
+                pos = nxt
+                k -= bit[nxt]
+            step >>= 1
+        return self._vals[pos]
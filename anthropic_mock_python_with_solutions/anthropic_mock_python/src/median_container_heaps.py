@@ -4,96 +4,146 @@ Time:
 - add/remove/median: O(log n) amortized
 Behavior:
 - "Lower median" invariant: left heap (max-heap) always holds the median.
+- Both heap tops are pruned (never lazily deleted) between public calls.
 """
-import heapq
-from collections import defaultdict
+from heapq import heappop, heappush, heappushpop
+from typing import Iterable
 
 class MedianContainer:
     def __init__(self) -> None:
         # left: max-heap via negatives; right: min-heap
+        # (the list objects are never rebound, so methods may alias them locally)
         self.left = []   # stores negatives
         self.right = []  # stores positives
         self.left_size = 0   # counts of valid elements in left
         self.right_size = 0  # counts of valid elements in right
-        self.delayed = defaultdict(int)  # values scheduled for deletion
-        self.freq = defaultdict(int)     # actual multiset counts
+        # plain dicts holding live keys only; entries are deleted at zero
+        self.delayed = {}  # values scheduled for deletion
+        self.freq = {}     # actual multiset counts
         self.n = 0
 
     # Helpers
     def _prune_left(self):
-        while self.left and self.delayed[-self.left[0]] > 0:
-            v = -heapq.heappop(self.left)
-            self.delayed[v] -= 1
+        left, delayed = self.left, self.delayed
+        while left:
+            v = -left[0]
+            c = delayed.get(v, 0)
+            if not c:
+                break
+            heappop(left)
+            if c == 1:
+                del delayed[v]
+            else:
+                delayed[v] = c - 1
 
     def _prune_right(self):
-        while self.right and self.delayed[self.right[0]] > 0:
-            v = heapq.heappop(self.right)
-            self.delayed[v] -= 1
+        right, delayed = self.right, self.delayed
+        while right:
+            v = right[0]
+            c = delayed.get(v, 0)
+            if not c:
+                break
+            heappop(right)
+            if c == 1:
+                del delayed[v]
+            else:
+                delayed[v] = c - 1
 
     def _rebalance(self):
         # ensure left_size >= right_size and difference <= 1
         if self.left_size < self.right_size:
             # move one from right to left
             self._prune_right()
-            v = heapq.heappop(self.right)
-            heapq.heappush(self.left, -v)
+            v = heappop(self.right)
+            heappush(self.left, -v)
             self.right_size -= 1
             self.left_size += 1
             self._prune_right()
         elif self.left_size - self.right_size > 1:
             # move one from left to right
             self._prune_left()
-            v = -heapq.heappop(self.left)
-            heapq.heappush(self.right, v)
+            v = -heappop(self.left)
+            heappush(self.right, v)
             self.left_size -= 1
             self.right_size += 1
             self._prune_left()
 
     def add(self, x: int) -> None:
-        if self.left_size == 0:
-            heapq.heappush(self.left, -x)
-            self.left_size += 1
+        # Sizes are balanced on entry (left == right or left == right + 1), so
+        # whenever x lands on the side that would overflow, push x and pop that
+        # side's top in one heappushpop and hand the popped value across.
+        left, right = self.left, self.right
+        left_size, right_size = self.left_size, self.right_size
+        if left_size == 0:
+            heappush(left, -x)
+            self.left_size = 1
+        elif x <= -left[0]:
+            if left_size > right_size:
+                heappush(right, -heappushpop(left, -x))
+                self.right_size = right_size + 1
+                self._prune_left()
+            else:
+                heappush(left, -x)
+                self.left_size = left_size + 1
         else:
-            self._prune_left()
-            median = -self.left[0] if self.left else (self.right[0] if self.right else x)
-            if x <= median:
-                heapq.heappush(self.left, -x)
-                self.left_size += 1
+            if left_size == right_size:
+                heappush(left, -heappushpop(right, x))
+                self.left_size = left_size + 1
+                self._prune_right()
             else:
-                heapq.heappush(self.right, x)
-                self.right_size += 1
-        self.freq[x] += 1
+                heappush(right, x)
+                self.right_size = right_size + 1
+        self.freq[x] = self.freq.get(x, 0) + 1
         self.n += 1
-        self._rebalance()
+
+    def add_many(self, xs: Iterable[int]) -> None:
+        """Insert every x in xs; bulk batches rebuild both heaps in one pass."""
+        xs = list(xs)
+        if len(xs) < self.n:
+            # small batch: k pushes beat rebuilding n elements
+            for x in xs:
+                self.add(x)
+            return
+        freq = self.freq
+        values = [v for v, c in freq.items() for _ in range(c)]
+        values.extend(xs)
+        for x in xs:
+            freq[x] = freq.get(x, 0) + 1
+        # an ascending list is already a valid min-heap, so no heapify is needed
+        values.sort()
+        h = (len(values) + 1) // 2
+        self.left[:] = [-v for v in reversed(values[:h])]
+        self.right[:] = values[h:]
+        self.left_size, self.right_size = h, len(values) - h
+        self.delayed.clear()
+        self.n = len(values)
 
     def remove(self, x: int) -> bool:
-        if self.freq[x] == 0:
+        freq = self.freq
+        c = freq.get(x, 0)
+        if not c:
             return False
-        self.freq[x] -= 1
-        self.delayed[x] += 1
+        if c == 1:
+            del freq[x]
+        else:
+            freq[x] = c - 1
+        self.delayed[x] = self.delayed.get(x, 0) + 1
         self.n -= 1
 
-        # Decide which heap's "size" to decrement based on current median
-        self._prune_left()
-        median = -self.left[0] if self.left else (self.right[0] if self.right else x)
-        if x <= median:
+        # Both tops are valid between operations, so the median can be read
+        # before pruning; only the heap holding x can expose a stale top.
+        if x <= -self.left[0]:
             self.left_size -= 1
-            if self.left_size < 0:
-                self.left_size = 0  # safety
+            self._prune_left()
         else:
             self.right_size -= 1
-            if self.right_size < 0:
-                self.right_size = 0  # safety
-
-        # Clean up tops if needed and rebalance
-        self._prune_left()
-        self._prune_right()
-        self._rebalance()
-        self._prune_left()
+            self._prune_right()
+        d = self.left_size - self.right_size
+        if d < 0 or d > 1:
+            self._rebalance()
         return True
 
     def median(self) -> int:
         if self.n == 0:
             raise ValueError("empty")
-        self._prune_left()
         return -self.left[0]
@@ -0,0 +1,195 @@
+"""
+Reference solution (two-heaps + lazy deletion, Numba-compiled sifts).
+Same algorithm as median_container_heaps.py, but both heaps are preallocated
+numpy int64 arrays and every sift runs in an @njit kernel.
+Time:
+- add/remove/median: O(log n) amortized
+Notes:
+- Values must fit in int64.
+- Kernels use cache=True; the first call in a fresh environment pays the
+  JIT compile, so time steady-state runs separately from the warm-up.
+"""
+import numpy as np
+from numba import njit
+
+# Min-heap kernels over arr[:n]; the left (max) heap stores negatives.
+@njit(cache=True)
+def _sift_up(arr, i):
+    x = arr[i]
+    while i > 0:
+        parent = (i - 1) >> 1
+        if arr[parent] <= x:
+            break
+        arr[i] = arr[parent]
+        i = parent
+    arr[i] = x
+
+@njit(cache=True)
+def _sift_down(arr, n, i):
+    x = arr[i]
+    while True:
+        child = 2 * i + 1
+        if child >= n:
+            break
+        if child + 1 < n and arr[child + 1] < arr[child]:
+            child += 1
+        if x <= arr[child]:
+            break
+        arr[i] = arr[child]
+        i = child
+    arr[i] = x
+
+@njit(cache=True)
+def _push(arr, n, x):
+    arr[n] = x
+    _sift_up(arr, n)
+    return n + 1
+
+@njit(cache=True)
+def _pop(arr, n):
+    top = arr[0]
+    n -= 1
+    if n > 0:
+        arr[0] = arr[n]
+        _sift_down(arr, n, 0)
+    return top, n
+
+@njit(cache=True)
+def _pushpop(arr, n, x):
+    # push x then pop the minimum, in one sift
+    if n > 0 and arr[0] < x:
+        top = arr[0]
+        arr[0] = x
+        _sift_down(arr, n, 0)
+        return top
+    return x
+
+def _grow(arr, n):
+    # geometric growth: one allocation, copy only the live prefix
+    out = np.empty(2 * len(arr), dtype=np.int64)
+    out[:n] = arr[:n]
+    return out
+
+class MedianContainer:
+    def __init__(self, capacity: int = 1024) -> None:
+        # left: max-heap via negatives; right: min-heap
+        # Buffers are reused for the container's lifetime and only ever grow.
+        capacity = max(1, capacity)
+        self.left = np.empty(capacity, dtype=np.int64)
+        self.right = np.empty(capacity, dtype=np.int64)
+        self.left_len = 0    # physical heap lengths, including stale entries
+        self.right_len = 0
+        self.left_size = 0   # counts of valid elements in left
+        self.right_size = 0  # counts of valid elements in right
+        self.delayed = {}  # values scheduled for deletion (live keys only)
+        self.freq = {}     # actual multiset counts (live keys only)
+        self.n = 0
+
+    # Helpers
+    def _push_left(self, v: int) -> None:
+        if self.left_len == len(self.left):
+            self.left = _grow(self.left, self.left_len)
+        self.left_len = _push(self.left, self.left_len, v)
+
+    def _push_right(self, v: int) -> None:
+        if self.right_len == len(self.right):
+            self.right = _grow(self.right, self.right_len)
+        self.right_len = _push(self.right, self.right_len, v)
+
+    def _prune_left(self):
+        delayed = self.delayed
+        while self.left_len:
+            v = -int(self.left[0])
+            c = delayed.get(v, 0)
+            if not c:
+                break
+            _, self.left_len = _pop(self.left, self.left_len)
+            if c == 1:
+                del delayed[v]
+            else:
+                delayed[v] = c - 1
+
+    def _prune_right(self):
+        delayed = self.delayed
+        while self.right_len:
+            v = int(self.right[0])
+            c = delayed.get(v, 0)
+            if not c:
+                break
+            _, self.right_len = _pop(self.right, self.right_len)
+            if c == 1:
+                del delayed[v]
+            else:
+                delayed[v] = c - 1
+
+    def _rebalance(self):
+        # ensure left_size >= right_size and difference <= 1
+        if self.left_size < self.right_size:
+            # move one from right to left
+            v, self.right_len = _pop(self.right, self.right_len)
+            self._push_left(-v)
+            self.right_size -= 1
+            self.left_size += 1
+            self._prune_right()
+        elif self.left_size - self.right_size > 1:
+            # move one from left to right
+            v, self.left_len = _pop(self.left, self.left_len)
+            self._push_right(-v)
+            self.left_size -= 1
+            self.right_size += 1
+            self._prune_left()
+
+    def add(self, x: int) -> None:
+        # Sizes are balanced on entry, so an overflowing side does one fused
+        # pushpop and hands its old top across (see median_container_heaps.py).
+        if self.left_size == 0:
+            self._push_left(-x)
+            self.left_size = 1
+        elif x <= -self.left[0]:
+            if self.left_size > self.right_size:
+                self._push_right(-_pushpop(self.left, self.left_len, -x))
+                self.right_size += 1
+                self._prune_left()
+            else:
+                self._push_left(-x)
+                self.left_size += 1
+        else:
+            if self.left_size == self.right_size:
+                self._push_left(-_pushpop(self.right, self.right_len, x))
+                self.left_size += 1
+                self._prune_right()
+            else:
+                self._push_right(x)
+                self.right_size += 1
+        self.freq[x] = self.freq.get(x, 0) + 1
+        self.n += 1
+
+    def remove(self, x: int) -> bool:
+        freq = self.freq
+        c = freq.get(x, 0)
+        if not c:
+            return False
+        if c == 1:
+            del freq[x]
+        else:
+            freq[x] = c - 1
+        self.delayed[x] = self.delayed.get(x, 0) + 1
+        self.n -= 1
+
+        # Both tops are valid between operations; only the heap holding x
+        # can expose a stale top.
+        if x <= -self.left[0]:
+            self.left_size -= 1
+            self._prune_left()
+        else:
+            self.right_size -= 1
+            self._prune_right()
+        d = self.left_size - self.right_size
+        if d < 0 or d > 1:
+            self._rebalance()
+        return True
+
+    def median(self) -> int:
+        if self.n == 0:
+            raise ValueError("empty")
+        return -int(self.left[0])
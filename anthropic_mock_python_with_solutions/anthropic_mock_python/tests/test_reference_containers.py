@@ -0,0 +1,57 @@
+import random
+import pytest
+
+REFERENCE_MODULES = [
+    "src.median_container_bisect",
+    "src.median_container_heaps",
+    "src.median_container_fenwick",
+    "src.median_container_numba",
+]
+LO, HI = -20, 20
+
+def make_container(module_name):
+    # skips when an optional dependency (sortedcontainers, numba) is missing
+    module = pytest.importorskip(module_name)
+    if module_name.endswith("_fenwick"):
+        return module.MedianContainer(range(LO, HI + 1))
+    return module.MedianContainer()
+
+def lower_median(sorted_values):
+    return sorted_values[(len(sorted_values) - 1) // 2]
+
+@pytest.mark.parametrize("module_name", REFERENCE_MODULES)
+@pytest.mark.parametrize("seed", range(20))
+def test_randomized_mixed_ops_against_model(module_name, seed):
+    rng = random.Random(seed)
+    mc = make_container(module_name)
+    add_many = getattr(mc, "add_many", None)
+    model = []
+    for _ in range(400):
+        op = rng.choice(["add", "add_many", "remove", "remove"])
+        if op == "add":
+            x = rng.randint(LO, HI)
+            mc.add(x)
+            model.append(x)
+        elif op == "add_many":
+            # batches are sometimes larger and sometimes smaller than the
+            # container, covering both the rebuild and incremental paths
+            xs = [rng.randint(LO, HI) for _ in range(rng.randint(0, 30))]
+            if add_many is not None:
+                add_many(iter(xs))
+            else:
+                for x in xs:
+                    mc.add(x)
+            model.extend(xs)
+        else:
+            x = rng.randint(LO, HI)
+            got = mc.remove(x)
+            if x in model:
+                model.remove(x)
+                assert got is True
+            else:
+                assert got is False
+        if model:
+            assert mc.median() == lower_median(sorted(model))
+        else:
+            with pytest.raises(ValueError):
+                mc.median()
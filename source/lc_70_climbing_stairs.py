@@ -1,15 +1,24 @@
+from functools import lru_cache
+
 class ClimbingStairs():
     def __init__(self):
         pass
 
-    def climb(self, i: int, n: int) -> int:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def climb(i: int, n: int) -> int:
+        # recursive form kept for reference; memoized on (i, n) so each step is computed once
         if i > n:
             return 0
         if i == n:
             return 1
-        return self.climb(i+1, n) + self.climb(i+2, n)
-    
+        return ClimbingStairs.climb(i+1, n) + ClimbingStairs.climb(i+2, n)
+
     def solve(self, n: int)->int:
-        return self.climb(0, n)
-        
-    
\ No newline at end of file
+        # ways(n) = ways(n-1) + ways(n-2); roll the two previous values
+        if n < 2:
+            return 1
+        a, b = 1, 1
+        for _ in range(n - 1):
+            a, b = b, a + b
+        return b
@@ -0,0 +1,162 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional C-speed versions of solution3's ASCII text helpers.
+
+Build in place with:
+    python setup_normalize_fast.py build_ext --inplace
+solution3.py imports this module when it is available and otherwise keeps its
+pure-Python (regex + str.translate) path. Both entry points accept ASCII only;
+the caller routes anything else to the regex fallback.
+"""
+from libc.stdlib cimport malloc, free
+
+cdef const char* NEG_AUX[13]
+NEG_AUX[:] = [b"don't", b"doesn't", b"didn't", b"cannot", b"can't", b"won't", b"isn't",
+              b"aren't", b"wasn't", b"weren't", b"shouldn't", b"wouldn't", b"couldn't"]
+cdef const char* SPLIT_AUX[8]
+SPLIT_AUX[:] = [b"does", b"do", b"is", b"are", b"was", b"were", b"has", b"have"]
+
+cdef inline bint _is_word(unsigned char c) noexcept nogil:
+    # \w on ASCII
+    return (c >= 97 and c <= 122) or (c >= 65 and c <= 90) or (c >= 48 and c <= 57) or c == 95
+
+cdef inline bint _is_space(unsigned char c) noexcept nogil:
+    # \s on ASCII: \t \n \v \f \r, \x1c-\x1f and space
+    return (c >= 9 and c <= 13) or (c >= 28 and c <= 32)
+
+cdef inline bint _is_kept(unsigned char c) noexcept nogil:
+    # characters normalize_text keeps: \w plus + - ( )
+    return _is_word(c) or c == 43 or c == 45 or c == 40 or c == 41
+
+cdef inline bint _is_digit(unsigned char c) noexcept nogil:
+    return c >= 48 and c <= 57
+
+cdef Py_ssize_t _lit(const unsigned char* s, Py_ssize_t n, Py_ssize_t i,
+                     const char* lit) noexcept nogil:
+    # end of 'lit' if it occurs at s[i], else -1
+    cdef Py_ssize_t k = 0
+    while lit[k]:
+        if i + k >= n or s[i + k] != <unsigned char>lit[k]:
+            return -1
+        k += 1
+    return i + k
+
+cdef Py_ssize_t _neg_at(const unsigned char* s, Py_ssize_t n, Py_ssize_t i) noexcept nogil:
+    # (?:NEG_AUX)\b at s[i]
+    cdef Py_ssize_t a, j
+    for a in range(13):
+        j = _lit(s, n, i, NEG_AUX[a])
+        if j >= 0 and (j == n or not _is_word(s[j])):
+            return j
+    return -1
+
+cdef Py_ssize_t _neg_match(const unsigned char* s, Py_ssize_t n, Py_ssize_t i) noexcept nogil:
+    """
+    End of a NEG_RE match starting at word start s[i], else -1. Mirrors the
+    regex alternation order: 'AUX? NEG' first, then 'AUX not'.
+    """
+    cdef Py_ssize_t a, j, k, e
+    for a in range(8):
+        j = _lit(s, n, i, SPLIT_AUX[a])
+        if j >= 0 and j < n and _is_space(s[j]):
+            k = j
+            while k < n and _is_space(s[k]):
+                k += 1
+            e = _neg_at(s, n, k)
+            if e >= 0:
+                return e
+    e = _neg_at(s, n, i)
+    if e >= 0:
+        return e
+    for a in range(8):
+        j = _lit(s, n, i, SPLIT_AUX[a])
+        if j >= 0 and j < n and _is_space(s[j]):
+            k = j
+            while k < n and _is_space(s[k]):
+                k += 1
+            e = _lit(s, n, k, b"not")
+            if e >= 0 and (e == n or not _is_word(s[e])):
+                return e
+    return -1
+
+def normalize_ascii(str s):
+    """
+    Single pass equivalent of solution3.normalize_text for an already-lowercased
+    ASCII string: negation forms -> 'not', every run of characters other than
+    \\w + - ( ) -> one space, no leading/trailing space.
+    """
+    cdef bytes raw = s.encode("ascii")
+    cdef const unsigned char* src = raw
+    cdef Py_ssize_t n = len(raw)
+    cdef Py_ssize_t i = 0, e, m = 0
+    cdef bint gap = False
+    cdef unsigned char c
+    # replacements only shrink the text, so n bytes always suffice
+    cdef char* out = <char*>malloc(n + 1)
+    if out == NULL:
+        raise MemoryError()
+    try:
+        while i < n:
+            c = src[i]
+            if _is_word(c) and (i == 0 or not _is_word(src[i - 1])):
+                e = _neg_match(src, n, i)
+                if e >= 0:
+                    if gap and m:
+                        out[m] = 32
+                        m += 1
+                    gap = False
+                    out[m] = 110; out[m + 1] = 111; out[m + 2] = 116  # "not"
+                    m += 3
+                    i = e
+                    continue
+            if _is_kept(c):
+                if gap and m:
+                    out[m] = 32
+                    m += 1
+                gap = False
+                out[m] = c
+                m += 1
+            else:
+                gap = True
+            i += 1
+        return out[:m].decode("ascii")
+    finally:
+        free(out)
+
+def index_fact(dict index, str fact):
+    """
+    ASCII version of solution3.index_fact: append the fact's first integer
+    (or None) to the posting list of each distinct \\w+ token.
+    """
+    cdef bytes raw = fact.encode("ascii")
+    cdef const unsigned char* src = raw
+    cdef Py_ssize_t n = len(raw)
+    cdef Py_ssize_t i = 0, start
+    cdef object num = None
+    cdef set tokens = set()
+    cdef list posting
+    # first -?\d+ match
+    while i < n:
+        if _is_digit(src[i]) or (src[i] == 45 and i + 1 < n and _is_digit(src[i + 1])):
+            start = i
+            i += 1
+            while i < n and _is_digit(src[i]):
+                i += 1
+            num = int(raw[start:i])
+            break
+        i += 1
+    i = 0
+    while i < n:
+        if _is_word(src[i]):
+            start = i
+            while i < n and _is_word(src[i]):
+                i += 1
+            tokens.add(raw[start:i].decode("ascii"))
+        else:
+            i += 1
+    for tok in tokens:
+        posting = index.get(tok)
+        if posting is None:
+            index[tok] = [num]
+        else:
+            posting.append(num)
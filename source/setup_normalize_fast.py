@@ -0,0 +1,8 @@
+"""
+Build the optional normalize_fast extension used by solution3.py:
+    python setup_normalize_fast.py build_ext --inplace
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(name="normalize_fast", ext_modules=cythonize("normalize_fast.pyx"))
@@ -1,138 +1,206 @@
 #!/usr/bin/env python3
 # CPU-only, standard library only.
 import csv, re, sys
-from typing import Dict, Tuple, List
+from functools import lru_cache
+from typing import Dict, Tuple, List, NamedTuple
+
+NUM_RE = re.compile(r'(-?\d+)')
+RULE_ID_RE = re.compile(r'(R\d+):\s*(.*)', re.I)
 
 # --- Helpers to parse numbers like "$100" or "100" ---
 def extract_number(s: str) -> int:
-    m = re.search(r'(-?\d+)', s)
+    m = NUM_RE.search(s)
     return int(m.group(1)) if m else 0
 
+@lru_cache(maxsize=1024)
 def parse_preferences(pref_str: str) -> Dict[str,int]:
     """
     Parse priorities like: "R2>R1, R3>R2". Higher number => higher priority.
     Returns a dict of rule -> priority (default 0).
+    Cached per raw string, so callers must treat the dict as read-only.
     """
     prio: Dict[str,int] = {}
     # Assign increasing priority from left to right across each chain
-    for chain in re.split(r'[;,]\s*', pref_str.strip() or ''):
-        if not chain: 
+    for chain in pref_str.replace(',', ';').split(';'):
+        chain = chain.strip()
+        if not chain:
             continue
-        parts = re.split(r'\s*>\s*', chain)
+        parts = chain.split('>')
         # Highest priority is leftmost in the chain
         for rank, rule in enumerate(parts[::-1]):
             prio[rule.strip()] = max(prio.get(rule.strip(), 0), rank)  # keep max across chains
     return prio
 
-def facts_dict(facts: str) -> Dict[str,str]:
+@lru_cache(maxsize=1024)
+def split_rules(rules: str) -> Tuple[Tuple[str,str], ...]:
+    """
+    Split "R1: ...; R2: ..." into ((rule_id, body), ...); ids default to 'R?'.
+    Cached per raw string since scenarios share rule columns across rows.
+    """
+    items = []
+    for chunk in rules.split(';'):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        # Extract rule id like R1:
+        m = RULE_ID_RE.match(chunk)
+        rid = m.group(1) if m else "R?"
+        body = m.group(2) if m else chunk
+        items.append((rid, body))
+    return tuple(items)
+
+class Facts(NamedTuple):
+    amounts: Tuple[Tuple[str,int], ...]  # (fact, first integer) of facts with '$' or a digit
+    friends: int                         # count from the last "... friends" fact
+    text: str                            # lowercased facts joined by ' ', for phrase tests
+
+def parse_facts(facts: str) -> Facts:
+    """
+    Single pass over the facts: amounts and friend counts are extracted up front
+    so the rules below never re-scan or re-parse the fact strings.
+    """
+    amounts = []
+    friends = 0
+    lines = []
+    for f in facts.split(';'):
+        fs = f.strip().lower()
+        if not fs:
+            continue
+        lines.append(fs)
+        m = NUM_RE.search(fs)
+        if m or '$' in fs:
+            amounts.append((fs, int(m.group(1)) if m else 0))
+        if 'friends' in fs:
+            friends = extract_number(fs)
+    return Facts(tuple(amounts), friends, ' '.join(lines))
+
+def sum_money(facts: Facts, who: str) -> int:
     """
-    Very simple normalization into key->value-ish strings for demo rules.
+    Total of the first integer of every fact mentioning 'who' (substring test,
+    so any amount counts, e.g. "frog has 1 coins" or "frog has 12 friends").
     """
-    return { i: f.strip().lower() for i, f in enumerate(re.split(r';\s*', facts.strip())) if f.strip() }
+    return sum(n for fs, n in facts.amounts if who in fs)
+
+# --- Toy-rule handlers: each checks only the facts side of one rule shape and
+# returns (applies, effect), or None to fall through to the next shape ---
+def _frog_builds(facts: Facts):
+    frog = sum_money(facts, 'frog')
+    dog  = sum_money(facts, 'dog')
+    lion = sum_money(facts, 'lion')
+    return (frog > (dog + lion), 'support')
+
+def _frog_attacks(facts: Facts):
+    # If a rule blocks building when attacking
+    return (True, 'block') if 'frog attacks cat' in facts.text else None
 
-def sum_money(fd: Dict[str,str], who: str) -> int:
-    total = 0
-    for v in fd.values():
-        if who in v and ('$' in v or re.search(r'\d', v)):
-            total += extract_number(v)
-    return total
+def _seal_device(facts: Facts):
+    return (True, 'support') if 'has internet device' in facts.text else None
 
-def rule_applies(rule: str, fd: Dict[str,str]) -> Tuple[bool, str]:
+def _seal_older(facts: Facts):
+    return (True, 'support') if 'older than 2' in facts.text else None
+
+def _camel_smiles(facts: Facts):
+    return (facts.friends > 10, 'support')  # smile is intermediate support
+
+def _camel_no_swim(facts: Facts):
+    # if smiling implied earlier, treat as block if smile holds
+    return (facts.friends > 10, 'block')
+
+def _alarm_triggers(facts: Facts):
+    return (True, 'support') if 'intrudes fields' in facts.text else None
+
+def _alarm_blocked(facts: Facts):
+    return (True, 'block') if 'cat guards fields' in facts.text else None
+
+def _lion_hungry(facts: Facts):
+    return ('lion is hungry' in facts.text, 'support')
+
+def _lion_scarce(facts: Facts):
+    return ('food is scarce' in facts.text, 'block')
+
+# Rule-text tests paired with their handler, in priority order
+RULE_HANDLERS = [
+    (lambda r: 'frog' in r and 'build' in r and '>' in r and '(dog+lion)' in r, _frog_builds),
+    (lambda r: 'does not build' in r or 'not build' in r, _frog_attacks),
+    (lambda r: 'seal reveals secret' in r and 'has internet device' in r, _seal_device),
+    (lambda r: 'seal reveals secret' in r and 'older than 2' in r, _seal_older),
+    (lambda r: 'camel smiles' in r and '>10 friends' in r, _camel_smiles),
+    (lambda r: 'camel does not swim' in r and 'camel smiles' in r, _camel_no_swim),
+    (lambda r: 'alarm triggers' in r, _alarm_triggers),
+    (lambda r: 'alarm does not trigger' in r or 'alarm not trigger' in r, _alarm_blocked),
+    (lambda r: 'lion hunts' in r and 'lion is hungry' in r, _lion_hungry),
+    (lambda r: 'lion hunts' in r and 'food is scarce' in r, _lion_scarce),
+]
+
+@lru_cache(maxsize=1024)
+def rule_dispatch(r: str) -> tuple:
+    """
+    Run the rule-text tests once per distinct (lowercased) rule body and
+    keep the matching handlers, so later rows only evaluate facts.
+    """
+    return tuple(handler for test, handler in RULE_HANDLERS if test(r))
+
+def rule_applies(rule: str, facts: Facts) -> Tuple[bool, str]:
     """
     Determine if a rule antecedent holds under the facts.
     Return (applies, effect) where effect is 'support' or 'block' wrt the question.
     Implemented for the supplied toy rules only.
     """
-    r = rule.lower().strip()
-    # --- Frog money comparison rules ---
-    if 'frog' in r and 'build' in r and '>' in r and '(dog+lion)' in r:
-        frog = sum_money(fd, 'frog')
-        dog  = sum_money(fd, 'dog')
-        lion = sum_money(fd, 'lion')
-        cond = frog > (dog + lion)
-        return (cond, 'support')
-    if 'frog attacks cat' in ' '.join(fd.values()):
-        # If a rule blocks building when attacking
-        if 'does not build' in r or "not build" in r:
-            return (True, 'block')
-    # --- Seal reveal secret rules ---
-    if 'seal reveals secret' in r:
-        if 'has internet device' in ' '.join(fd.values()) and 'has internet device' in r:
-            return (True, 'support')
-        if 'older than 2' in ' '.join(fd.values()) and 'older than 2' in r:
-            return (True, 'support')
-    # --- Camel swim rules ---
-    if 'camel smiles' in r and '>10 friends' in r:
-        # check friends count
-        friends = 0
-        for v in fd.values():
-            if 'friends' in v:
-                friends = extract_number(v)
-        return (friends > 10, 'support')  # smile is intermediate support
-    if 'camel does not swim' in r and 'camel smiles' in r:
-        # if smiling implied earlier, treat as block if smile holds
-        friends = 0
-        for v in fd.values():
-            if 'friends' in v:
-                friends = extract_number(v)
-        return (friends > 10, 'block')
-    # --- Alarm trigger rules ---
-    if 'intrudes fields' in ' '.join(fd.values()) and 'alarm triggers' in r:
-        return (True, 'support')
-    if 'cat guards fields' in ' '.join(fd.values()) and ('alarm does not trigger' in r or 'alarm not trigger' in r):
-        return (True, 'block')
-    # --- Lion hunts ---
-    if 'lion hunts' in r:
-        hungry = 'lion is hungry' in ' '.join(fd.values())
-        scarce = 'food is scarce' in ' '.join(fd.values())
-        if 'lion is hungry' in r:
-            return (hungry, 'support')
-        if 'food is scarce' in r:
-            return (scarce, 'block')
+    for handler in rule_dispatch(rule.lower().strip()):
+        result = handler(facts)
+        if result is not None:
+            return result
     return (False, '')
 
-def answer_from_effects(effects: List[Tuple[str,int]]) -> str:
+def answer_from_effects(effects: List[Tuple[bool,int]]) -> str:
     """
-    Given list of (effect, priority) where effect in {'support','block'},
-    decide Proved / Disproved / Unknown using highest-priority outcome.
+    Given list of (is_block, priority) where is_block is True for 'block' and
+    False for 'support', decide Proved / Disproved / Unknown using highest-priority outcome.
     """
     if not effects:
         return "Unknown"
     # pick the max priority, then prefer block over support if same
-    best = max(effects, key=lambda x: (x[1], 1 if x[0]=='support' else 2))
-    return "Proved" if best[0] == 'support' else "Disproved"
+    best_pri, best_is_block = -1, False
+    for is_block, pri in effects:
+        if pri > best_pri or (pri == best_pri and is_block):
+            best_pri, best_is_block = pri, is_block
+    return "Disproved" if best_is_block else "Proved"
 
+@lru_cache(maxsize=4096)  # rows often repeat the same scenario verbatim
 def predict_row(facts: str, rules: str, preferences: str, question: str) -> str:
-    fd = facts_dict(facts)
+    parsed = parse_facts(facts)
     # Parse preferences into priority map
     prio = parse_preferences(preferences)
     # Collect rule effects that apply
-    effects: List[Tuple[str,int]] = []
-    # Split rules by ; and iterate
-    for chunk in re.split(r';\s*', rules):
-        chunk = chunk.strip()
-        if not chunk:
-            continue
-        # Extract rule id like R1:
-        m = re.match(r'(R\d+):\s*(.*)', chunk, flags=re.I)
-        rid = m.group(1) if m else f"R?"
-        body = m.group(2) if m else chunk
-        applies, effect = rule_applies(body, fd)
+    effects: List[Tuple[bool,int]] = []
+    for rid, body in split_rules(rules):
+        applies, effect = rule_applies(body, parsed)
         if applies and effect:
-            effects.append((effect, prio.get(rid, 0)))
+            effects.append((effect == 'block', prio.get(rid, 0)))
     return answer_from_effects(effects)
 
 def eval_csv(path: str) -> float:
     total, correct = 0, 0
+    # Collect report lines and write them once instead of printing per row
+    lines: List[str] = []
+    append = lines.append
     with open(path, newline='') as f:
-        r = csv.DictReader(f)
+        r = csv.reader(f)
+        # Resolve column positions once; rows are then plain lists
+        cols = ('id', 'facts', 'rules', 'preferences', 'question', 'label')
+        idx = {name: i for i, name in enumerate(next(r, cols))}
+        ii, fi, ri, pi, qi, li = (idx[k] for k in cols)
         for row in r:
-            pred = predict_row(row['facts'], row['rules'], row['preferences'], row['question'])
-            ok = (pred == row['label'])
-            total += 1; correct += int(ok)
-            print(f"id:{row['id']} predicted: {pred} ({'correct' if ok else 'wrong'})")
-    acc = correct / max(1,total)
-    print(f"Overall Accuracy: {acc:.2f}")
+            if not row:
+                continue  # blank line; DictReader skipped these too
+            pred = predict_row(row[fi], row[ri], row[pi], row[qi])
+            ok = (pred == row[li])
+            total += 1
+            correct += ok
+            append(f"id:{row[ii]} predicted: {pred} ({'correct' if ok else 'wrong'})\n")
+    acc = correct / max(1, total)
+    append(f"Overall Accuracy: {acc:.2f}\n")
+    sys.stdout.write(''.join(lines))
     return acc
 
 if __name__ == '__main__':
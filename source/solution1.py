@@ -1,5 +1,14 @@
 import csv
+import operator
 import re
+import sys
+from functools import lru_cache
+from typing import Callable, List
+
+MONEY_RE = re.compile(r'(\w+)\s+has\s+\$(\d+)', re.IGNORECASE)
+FRIENDS_RE = re.compile(r'(\w+)\s+has\s+(\d+)\s+friends', re.IGNORECASE)
+RULE_RE = re.compile(r'(R\d+):\s+if\s+(.+)\s+then\s+(.+)', re.IGNORECASE)
+QUESTION_RE = re.compile(r'Does\s+([\w\s]+)\?', re.IGNORECASE)
 
 def parse_facts(facts_str: str) -> dict:
     """
@@ -13,8 +22,8 @@ def parse_facts(facts_str: str) -> dict:
         if not item:
             continue
         # Case for numerical facts, e.g., 'Frog has $100' or 'Camel has 11 friends'
-        match_num = re.search(r'(\w+)\s+has\s+\$(\d+)', item, re.IGNORECASE)
-        match_num_friends = re.search(r'(\w+)\s+has\s+(\d+)\s+friends', item, re.IGNORECASE)
+        match_num = MONEY_RE.search(item)
+        match_num_friends = FRIENDS_RE.search(item)
         
         if match_num:
             entity, value = match_num.groups()
@@ -27,9 +36,11 @@ def parse_facts(facts_str: str) -> dict:
             facts[item.lower()] = True
     return facts
 
+@lru_cache(maxsize=1024)
 def parse_rules(rules_str: str) -> dict:
     """
     Parses a string of rules and extracts their conditions and conclusions.
+    Cached per raw string; the returned dict is shared and must not be mutated.
     """
     rules = {}
     rule_items = rules_str.strip().split(';')
@@ -37,38 +48,128 @@ def parse_rules(rules_str: str) -> dict:
         item = item.strip()
         if not item:
             continue
-        match = re.match(r'(R\d+):\s+if\s+(.+)\s+then\s+(.+)', item, re.IGNORECASE)
+        match = RULE_RE.match(item)
         if match:
             rule_id, condition, conclusion = match.groups()
             rules[rule_id] = {'condition': condition.strip(), 'conclusion': conclusion.strip()}
     return rules
 
+ENTITIES = ('frog', 'dog', 'lion', 'camel', 'seal')
+TOKEN_RE = re.compile(r'\s*(?:(\d+)|(\w+)|(>=|<=|==|!=|[<>()+-]))')
+THRESHOLD_RE = re.compile(r'>\s*(\d+)')
+COMPARATORS = {
+    '>': operator.gt, '<': operator.lt, '>=': operator.ge,
+    '<=': operator.le, '==': operator.eq, '!=': operator.ne,
+}
+
+def tokenize(expr: str) -> list:
+    """
+    Splits an arithmetic condition into (kind, text) tokens.
+    Raises SyntaxError on any character the grammar does not cover.
+    """
+    tokens = []
+    pos = 0
+    expr = expr.rstrip()
+    while pos < len(expr):
+        m = TOKEN_RE.match(expr, pos)
+        if not m:
+            raise SyntaxError(expr)
+        num, name, op = m.groups()
+        tokens.append(('num', num) if num else ('name', name) if name else ('op', op))
+        pos = m.end()
+    return tokens
+
+def parse_expression(tokens: list) -> Callable[[dict], int]:
+    """
+    Builds a closure for a sum of terms, e.g. 'frog', '-5' or '(dog+lion)'.
+    Grammar: sum := term (('+'|'-') term)* ; term := NUMBER | ENTITY | '(' sum ')' | '-' term
+    """
+    def term():
+        if not tokens:
+            raise SyntaxError('unexpected end of condition')
+        kind, text = tokens.pop(0)
+        if kind == 'num':
+            value = int(text)
+            return lambda facts: value
+        if kind == 'name':
+            if text not in ENTITIES:
+                raise SyntaxError(text)
+            def lookup(facts):
+                if text not in facts:
+                    raise NameError(text)
+                return facts[text]
+            return lookup
+        if text == '(':
+            inner = parse_sum()
+            if not tokens or tokens.pop(0) != ('op', ')'):
+                raise SyntaxError('unbalanced parentheses')
+            return inner
+        if text == '-':
+            operand = term()
+            return lambda facts: -operand(facts)
+        raise SyntaxError(text)
+
+    def parse_sum():
+        left = term()
+        while tokens and tokens[0] in (('op', '+'), ('op', '-')):
+            sign = tokens.pop(0)[1]
+            right = term()
+            if sign == '+':
+                left = (lambda l, r: lambda facts: l(facts) + r(facts))(left, right)
+            else:
+                left = (lambda l, r: lambda facts: l(facts) - r(facts))(left, right)
+        return left
+
+    return parse_sum()
+
+@lru_cache(maxsize=4096)
+def compile_condition(condition: str) -> Callable[[dict], bool]:
+    """
+    Compiles a rule condition once into a closure over the facts dict.
+    Supported shapes: a boolean fact ('frog attacks cat'), a friends threshold
+    ('>10 friends') and an entity comparison ('frog > (dog+lion)').
+    """
+    key = condition.lower()
+
+    threshold = THRESHOLD_RE.match(condition)
+    if threshold:
+        val = int(threshold.group(1))
+        test = lambda facts: any(v > val for k, v in facts.items() if '_friends' in k)
+    else:
+        try:
+            tokens = tokenize(condition)
+            left = parse_expression(tokens)
+            if tokens:
+                kind, op = tokens.pop(0)
+                if kind != 'op' or op not in COMPARATORS:
+                    raise SyntaxError(op)
+                right = parse_expression(tokens)
+                if tokens:
+                    raise SyntaxError(tokens[0][1])
+                compare = COMPARATORS[op]
+                test = lambda facts: compare(left(facts), right(facts))
+            else:
+                test = lambda facts: bool(left(facts))
+        except SyntaxError:
+            test = lambda facts: False
+
+    def check(facts: dict) -> bool:
+        try:
+            # Simple boolean check, e.g., 'frog attacks cat'
+            if key in facts:
+                return facts[key]
+            return test(facts)
+        except (NameError, TypeError):
+            # If an entity is not in facts or evaluation fails, the condition is not met.
+            return False
+    return check
+
 def evaluate_condition(condition: str, facts: dict) -> bool:
     """
     Evaluates a rule condition against a dictionary of facts.
-    Handles basic logical and arithmetic operations.
+    Each distinct condition string is parsed once (compile_condition is cached).
     """
-    try:
-        # Simple boolean check, e.g., 'frog attacks cat'
-        if condition.lower() in facts:
-            return facts[condition.lower()]
-        
-        # Handle numerical comparisons, e.g., '>10 friends'
-        if condition.startswith('>'):
-            val = int(condition.replace('>', ''))
-            return any(v > val for k, v in facts.items() if '_friends' in k)
-
-        # Handle arithmetic comparisons, e.g., 'frog > (dog+lion)'
-        for entity in ['frog', 'dog', 'lion', 'camel', 'seal']:
-            if entity in facts:
-                condition = condition.replace(entity, str(facts[entity]))
-        
-        # Evaluate the expression
-        return eval(condition)
-
-    except (NameError, TypeError, SyntaxError):
-        # If an entity is not in facts or evaluation fails, the condition is not met.
-        return False
+    return compile_condition(condition)(facts)
 
 def resolve_conflict(activated_rules: dict, preferences: str, question: str) -> str:
     """
@@ -81,7 +182,7 @@ def resolve_conflict(activated_rules: dict, preferences: str, question: str) ->
             final_conclusion = activated_rules[rule_id]['conclusion']
             
             # Check if the winning conclusion is about the question
-            q_entity = re.search(r'Does\s+([\w\s]+)\?', question, re.IGNORECASE)
+            q_entity = QUESTION_RE.search(question)
             if q_entity:
                 question_subject = q_entity.group(1).strip().lower()
                 if question_subject in final_conclusion.lower():
@@ -92,9 +193,11 @@ def resolve_conflict(activated_rules: dict, preferences: str, question: str) ->
     
     return "Unknown"
 
+@lru_cache(maxsize=4096)
 def predict_row(facts: str, rules: str, preferences: str, question: str) -> str:
     """
     Main prediction function for a single row.
+    Pure in its four string arguments, so duplicate rows are served from an LRU cache.
     """
     facts_parsed = parse_facts(facts)
     rules_parsed = parse_rules(rules)
@@ -126,16 +229,26 @@ def eval_csv(path: str) -> float:
     (Provided by the user)
     """
     total, correct = 0, 0
+    # Collect report lines and write them once instead of printing per row
+    lines: List[str] = []
+    append = lines.append
     with open(path, newline='') as f:
-        r = csv.DictReader(f)
+        r = csv.reader(f)
+        # Resolve column positions once; rows are then plain lists
+        cols = ('id', 'facts', 'rules', 'preferences', 'question', 'label')
+        idx = {name: i for i, name in enumerate(next(r, cols))}
+        ii, fi, ri, pi, qi, li = (idx[k] for k in cols)
         for row in r:
-            pred = predict_row(row['facts'], row['rules'], row['preferences'], row['question'])
-            ok = (pred == row['label'])
+            if not row:
+                continue  # blank line; DictReader skipped these too
+            pred = predict_row(row[fi], row[ri], row[pi], row[qi])
+            ok = (pred == row[li])
             total += 1
-            correct += int(ok)
-            print(f"id:{row['id']} predicted: {pred} ({'correct' if ok else 'wrong'})")
+            correct += ok
+            append(f"id:{row[ii]} predicted: {pred} ({'correct' if ok else 'wrong'})\n")
     acc = correct / max(1, total)
-    print(f"Overall Accuracy: {acc:.2f}")
+    append(f"Overall Accuracy: {acc:.2f}\n")
+    sys.stdout.write(''.join(lines))
     return acc
 
 if __name__ == '__main__':
@@ -1,30 +1,84 @@
 #!/usr/bin/env python3
-# CPU-only, standard library only.
-import csv, re, sys
-from typing import Dict, Tuple, List, Optional, Set
+# CPU-only, standard library only (normalize_fast is an optional compiled speedup).
+import csv, operator, os, re, string, sys
+from functools import lru_cache
+from multiprocessing import Pool
+from typing import Callable, Dict, FrozenSet, Tuple, List, NamedTuple, Optional, Set
+
+try:  # optional Cython build of the ASCII text helpers (see normalize_fast.pyx)
+    import normalize_fast
+except ImportError:
+    normalize_fast = None
+try:  # optional DFA regex engine (pip install google-re2) for long phrase scans
+    import re2
+except ImportError:
+    re2 = None
 
 # ----------------------------
 # Normalization helpers
 # ----------------------------
-AUX_NEG_PAT = re.compile(r"\b(don't|doesn't|didn't|cannot|can't|won't|isn't|aren't|wasn't|weren't|shouldn't|wouldn't|couldn't)\b")
-PUNCT_PAT = re.compile(r"[^\w\s\+\-\(\)]")
+NEG_AUX = r"don't|doesn't|didn't|cannot|can't|won't|isn't|aren't|wasn't|weren't|shouldn't|wouldn't|couldn't"
+SPLIT_AUX = r"does|do|is|are|was|were|has|have"
+# Negation forms in one alternation: a contraction (optionally after an
+# auxiliary, e.g. "does don't") or a split "does not" form -> "not"
+NEG_RE = re.compile(rf"\b(?:(?:{SPLIT_AUX})\s+)?(?:{NEG_AUX})\b|\b(?:{SPLIT_AUX})\s+not\b")
+# Any run of whitespace and punctuation other than + - ( ) -> a single space
+SEP_RE = re.compile(r"[^\w\+\-\(\)]+")
+# ASCII fast path for SEP_RE: map every non-word ASCII char except + - ( ) to a
+# space with str.translate, then collapse runs with split/join
+_KEEP = set(string.ascii_letters + string.digits + "_+-()")
+PUNCT_TABLE = {i: " " for i in range(128) if chr(i) not in _KEEP}
+NUM_RE = re.compile(r'(-?\d+)')
+WORD_RE = re.compile(r'\w+')
+Q_AUX_RE = re.compile(r"^(does|do|is|are|was|were|can|should|would|could)\s+")
+ARTICLE_RE = re.compile(r"^(the|a|an)\s+")
+PLURAL_RE = re.compile(r"\b(\w+?)s\b")
+QMARK_RE = re.compile(r"\?$")
+COMP_RE = re.compile(r"(>=|<=|!=|==|=|>|<)")
+THRESH_RE = re.compile(r"([><]=?)\s*(-?\d+)\s+(\w+)")
+
+@lru_cache(maxsize=4096)
+def word_re(term: str) -> "re.Pattern[str]":
+    """
+    Compiled whole-word matcher for a term, shared across facts and rows.
+    """
+    return re.compile(rf"\b{re.escape(term)}\b")
+
+# re2 only pays off on long haystacks: below this many characters Python's
+# backtracking re is faster (re2's per-call and match-object overhead dominates)
+RE2_MIN_LEN = 256
+
+@lru_cache(maxsize=4096)
+def word_search(term: str) -> Callable[[str], object]:
+    """
+    Whole-word search for a term over a long haystack such as all_facts_text.
+    Uses re2's linear-time DFA when installed and the haystack is long and ASCII
+    (re2's \b is ASCII-only, so other text keeps Python's re semantics).
+    """
+    search = word_re(term).search
+    if re2 is None:
+        return search
+    dfa_search = re2.compile(rf"\b{re.escape(term)}\b").search
+    def either(hay: str) -> object:
+        if len(hay) >= RE2_MIN_LEN and hay.isascii():
+            return dfa_search(hay)
+        return search(hay)
+    return either
 
+@lru_cache(maxsize=8192)
 def normalize_text(s: str) -> str:
     """
     Lowercase, expand common negation contractions into 'not', remove extra punctuation,
     collapse whitespace. Keep + - ( ) for simple expression parsing later.
     """
-    s = s.lower().strip()
-    # expand common negation contractions to include 'not'
-    s = AUX_NEG_PAT.sub("not", s)
-    # standardize "does not", "do not", "is not" forms when they appear split
-    s = re.sub(r"\b(does|do|is|are|was|were|has|have)\s+not\b", "not", s)
-    # remove punctuation except + - ( )
-    s = PUNCT_PAT.sub(" ", s)
-    # collapse spaces
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    s = s.lower()
+    if s.isascii():
+        if normalize_fast is not None:
+            return normalize_fast.normalize_ascii(s)
+        return " ".join(NEG_RE.sub("not", s).translate(PUNCT_TABLE).split())
+    return SEP_RE.sub(" ", NEG_RE.sub("not", s)).strip()
 
+@lru_cache(maxsize=8192)
 def normalize_predicate(s: str) -> str:
     """
     Build a light-weight, comparison-friendly predicate string from the question or conclusion.
@@ -33,16 +87,16 @@ def normalize_predicate(s: str) -> str:
     """
     s = normalize_text(s)
     # remove question words like 'does', 'do', 'is', etc. at start
-    s = re.sub(r"^(does|do|is|are|was|were|can|should|would|could)\s+", "", s)
+    s = Q_AUX_RE.sub("", s)
     # remove leading articles
-    s = re.sub(r"^(the|a|an)\s+", "", s)
+    s = ARTICLE_RE.sub("", s)
     # naive de-pluralize verbs like "builds" -> "build"
-    s = re.sub(r"\b(\w+?)s\b", r"\1", s)  # crude but helps for 'builds'/'triggers'
+    s = PLURAL_RE.sub(r"\1", s)  # crude but helps for 'builds'/'triggers'
     return s.strip()
 
 # --- Helpers to parse numbers like "$100" or "100" ---
 def extract_number(s: str) -> int:
-    m = re.search(r'(-?\d+)', s)
+    m = NUM_RE.search(s)
     return int(m.group(1)) if m else 0
 
 def parse_preferences(pref_str: str) -> Dict[str,int]:
@@ -54,10 +108,10 @@ def parse_preferences(pref_str: str) -> Dict[str,int]:
     if not pref_str:
         return prio
     # Assign increasing priority from left to right across each chain
-    for chain in re.split(r'[;,]\s*', pref_str.strip()):
+    for chain in pref_str.replace(',', ';').split(';'):
         if not chain:
             continue
-        parts = [p.strip() for p in re.split(r'\s*>\s*', chain) if p.strip()]
+        parts = [p for p in (q.strip() for q in chain.split('>')) if p]
         if not parts:
             continue
         # Rightmost gets lowest, leftmost highest
@@ -70,7 +124,7 @@ def facts_dict(facts: str) -> Dict[int,str]:
     Normalize facts into an index -> text dict, preserving each fact line.
     """
     items = []
-    for f in re.split(r';\s*', facts.strip()):
+    for f in facts.split(';'):
         f = f.strip()
         if f:
             items.append(normalize_text(f))
@@ -79,88 +133,148 @@ def facts_dict(facts: str) -> Dict[int,str]:
 def all_facts_text(fd: Dict[int,str]) -> str:
     return " ; ".join(fd.values())
 
+# Inverted index over the facts: word token -> first number (or None) of every
+# fact containing that token. A pure-word term matches r"\bterm\b" in a fact
+# exactly when it is one of the fact's \w+ tokens, so lookups replace scans.
+TokenIndex = Dict[str, List[Optional[int]]]
+
+def index_fact(index: TokenIndex, fact: str) -> None:
+    if normalize_fast is not None and fact.isascii():
+        normalize_fast.index_fact(index, fact)
+        return
+    m = NUM_RE.search(fact)
+    num = int(m.group(1)) if m else None
+    for tok in set(WORD_RE.findall(fact)):
+        index.setdefault(tok, []).append(num)
+
+def build_index(fd: Dict[int,str]) -> TokenIndex:
+    index: TokenIndex = {}
+    for v in fd.values():
+        index_fact(index, v)
+    return index
+
 # --- Numeric aggregation from facts ---
-def sum_for_term(fd: Dict[int, str], term: str) -> int:
+def scan_sum(fd: Dict[int, str], term_re: "re.Pattern[str]") -> int:
     """
-    Sum numeric values associated with a 'term' across all facts.
-    If a fact string contains the 'term' token, any number in that fact contributes.
+    Slow path for terms the token index cannot answer (multi-word or symbolic):
+    sum the first number of every fact the whole-word pattern matches.
     """
-    term = normalize_text(term)
     total = 0
     for v in fd.values():
         # ensure token-ish presence (avoid partials as much as possible)
-        if re.search(rf"\b{re.escape(term)}\b", v):
-            m = re.search(r'(-?\d+)', v)
+        if term_re.search(v):
+            m = NUM_RE.search(v)
             if m:
                 total += int(m.group(1))
     return total
 
-def eval_side_expression(fd: Dict[int, str], expr: str) -> int:
+# ----------------------------
+# Condition compilation
+# ----------------------------
+# Conditions are parsed once per distinct string into closures over
+# (fd, index[, hay]); rows then only run the closures.
+SideFn = Callable[[Dict[int, str], TokenIndex], int]
+CondFn = Callable[[Dict[int, str], TokenIndex, str], bool]
+
+OPS = {
+    ">": operator.gt, "<": operator.lt, ">=": operator.ge, "<=": operator.le,
+    "=": operator.eq, "==": operator.eq, "!=": operator.ne,
+}
+
+def _is_int(p: str) -> bool:
+    """
+    Same as re.fullmatch(r'-?\\d+', p): isdecimal is exactly \\d, unlike isdigit.
     """
-    Evaluate a simple additive expression like: 'frog', 'dog+lion', 'friends', '10', '(dog+lion)'
-    We support + between tokens; each token's value is sum_for_term(...) unless it's a pure number.
+    q = p[1:] if p[:1] == "-" else p
+    return q.isdecimal()
+
+@lru_cache(maxsize=4096)
+def compile_side(expr: str) -> SideFn:
+    """
+    Compile a simple additive expression like: 'frog', 'dog+lion', 'friends', '10', '(dog+lion)'
+    We support + between tokens; each token's value is the sum of the numbers in the facts
+    containing it (index lookup for words, scan_sum otherwise) unless it's a pure number.
     Parentheses are ignored (best-effort).
     """
     expr = normalize_text(expr)
     expr = expr.replace("(", "").replace(")", "")
     parts = [p.strip() for p in expr.split('+') if p.strip()]
-    total = 0
+    const = 0
+    words: List[str] = []
+    scans: List["re.Pattern[str]"] = []
     for p in parts:
-        if re.fullmatch(r'-?\d+', p):
-            total += int(p)
+        if _is_int(p):
+            const += int(p)
         else:
-            total += sum_for_term(fd, p)
-    return total
+            term = normalize_text(p)
+            if WORD_RE.fullmatch(term):
+                words.append(term)
+            else:
+                scans.append(word_re(term))
+
+    def value(fd: Dict[int, str], index: TokenIndex) -> int:
+        total = const
+        for term in words:
+            for n in index.get(term, ()):
+                if n is not None:
+                    total += n
+        for term_re in scans:
+            total += scan_sum(fd, term_re)
+        return total
+    return value
+
+def _zero(fd: Dict[int, str], index: TokenIndex) -> int:
+    return 0
 
-def evaluate_condition(fd: Dict[int,str], cond: str) -> bool:
+@lru_cache(maxsize=4096)
+def compile_condition(cond: str) -> CondFn:
     """
-    Evaluate 'cond' against facts. Supports comparators: >, <, >=, <=, =, ==, !=
+    Compile 'cond' into a predicate over the facts. Supports comparators: >, <, >=, <=, =, ==, !=
     Also supports unary thresholds like '> 10 friends' by interpreting the right-most number
     and left-most measure.
     Also supports phrase conditions (substring) when no comparator detected.
     """
     cond = normalize_text(cond)
     if not cond:
-        return True  # empty condition => tautology
+        return lambda fd, index, hay: True  # empty condition => tautology
 
     # First, comparator-based conditions
-    comp_pat = r"(>=|<=|!=|==|=|>|<)"
-    m = re.search(comp_pat, cond)
+    m = COMP_RE.search(cond)
     if m:
-        op = m.group(1)
+        op = OPS[m.group(1)]
         left = cond[:m.start()].strip()
         right = cond[m.end():].strip()
         # Evaluate both sides as expressions (sum tokens/numbers)
-        lv = eval_side_expression(fd, left) if left else 0
-        rv = eval_side_expression(fd, right) if right else 0
-        if op in (">",):   return lv > rv
-        if op in ("<",):   return lv < rv
-        if op in (">=",):  return lv >= rv
-        if op in ("<=",):  return lv <= rv
-        if op in ("=", "=="): return lv == rv
-        if op in ("!=",):  return lv != rv
-        return False
+        lv = compile_side(left) if left else _zero
+        rv = compile_side(right) if right else _zero
+        return lambda fd, index, hay: op(lv(fd, index), rv(fd, index))
 
     # Threshold pattern like '> 10 friends'
-    m2 = re.match(r"([><]=?)\s*(-?\d+)\s+(\w+)", cond)
+    m2 = THRESH_RE.match(cond)
     if m2:
-        op, num, measure = m2.group(1), int(m2.group(2)), m2.group(3)
-        lv = eval_side_expression(fd, measure)
-        rv = num
-        if op == ">":  return lv > rv
-        if op == "<":  return lv < rv
-        if op == ">=": return lv >= rv
-        if op == "<=": return lv <= rv
+        op, num, measure = OPS[m2.group(1)], int(m2.group(2)), compile_side(m2.group(3))
+        return lambda fd, index, hay: op(measure(fd, index), num)
 
     # Otherwise, treat as phrase existence: all content words must appear in facts
     words = [w for w in cond.split() if w not in {"if", "then", "and", "or"}]
-    hay = all_facts_text(fd)
-    return all(re.search(rf"\b{re.escape(w)}\b", hay) for w in words)
+    plain = tuple(w for w in words if WORD_RE.fullmatch(w))
+    scans = tuple(word_search(w) for w in words if not WORD_RE.fullmatch(w))
+
+    def phrase(fd: Dict[int, str], index: TokenIndex, hay: str) -> bool:
+        for w in plain:
+            if w not in index:
+                return False
+        if scans:
+            return all(search(hay) for search in scans)
+        return True
+    return phrase
 
 # ----------------------------
 # Rule parsing and application
 # ----------------------------
 RULE_ID_RE = re.compile(r'^\s*(R\d+):\s*(.*)$', re.I)
+IF_THEN_RE = re.compile(r"if\s+(.+?)\s+then\s+(.+)$")
+NEG_CONCL_RE = re.compile(r"\bnot\b|\bno\b|\bnever\b")
 
 def parse_rule(chunk: str) -> Tuple[str, str]:
     """
@@ -171,13 +285,14 @@ def parse_rule(chunk: str) -> Tuple[str, str]:
         return m.group(1), m.group(2)
     return "R?", chunk.strip()
 
+@lru_cache(maxsize=8192)
 def split_if_then(body: str) -> Tuple[str, str]:
     """
     Split 'if ... then ...' into (condition, conclusion).
     If no 'if' found, treat whole body as conclusion with empty condition.
     """
     body_n = normalize_text(body)
-    m = re.match(r"if\s+(.+?)\s+then\s+(.+)$", body_n)
+    m = IF_THEN_RE.match(body_n)
     if m:
         return m.group(1).strip(), m.group(2).strip()
     # Fallback: no explicit if/then => conclusion-only rule
@@ -189,35 +304,58 @@ def conclusion_is_negative(concl: str) -> bool:
     """
     c = normalize_text(concl)
     # common negation tokens after normalization
-    return bool(re.search(r"\bnot\b|\bno\b|\bnever\b", c))
+    return bool(NEG_CONCL_RE.search(c))
+
+STOP = frozenset({"the","a","an","to","of","in","on","at","by","for"})
+
+def predicate_tokens(text: str) -> FrozenSet[str]:
+    """
+    Content-word set of a conclusion or target predicate (stopwords removed).
+    """
+    return frozenset(normalize_predicate(text).split()) - STOP
 
-def predicate_match(conclusion: str, target_pred: str) -> bool:
+def predicate_match(cset: FrozenSet[str], tset: FrozenSet[str]) -> bool:
     """
-    Heuristic: check if conclusion overlaps with the target predicate (from the question).
-    We compare content-word sets with a lenient subset test.
+    Heuristic: check if a conclusion's token set overlaps with the target predicate's.
+    Both sets come from predicate_tokens and are computed once per row.
     """
-    c = normalize_predicate(conclusion)
-    t = normalize_predicate(target_predicate_text(target_pred))
-    # Token sets minus stopwords
-    stop = {"the","a","an","to","of","in","on","at","by","for"}
-    cset = {w for w in c.split() if w not in stop}
-    tset = {w for w in t.split() if w not in stop}
     # Match if tset is subset of cset, or vice versa if conclusion is shorter phrasing.
     return bool(tset) and (tset.issubset(cset) or cset.issubset(tset))
 
+@lru_cache(maxsize=8192)
 def target_predicate_text(question: str) -> str:
     """
     Extract a predicate-like text from the question. E.g.:
     'Does frog build plant?' -> 'frog build plant'
     """
     q = normalize_text(question)
-    q = re.sub(r"\?$", "", q)
-    q = re.sub(r"^(does|do|is|are|was|were|can|should|would|could)\s+", "", q)
+    q = QMARK_RE.sub("", q)
+    q = Q_AUX_RE.sub("", q)
     return q.strip()
 
-def rule_applies(rule: str, fd: Dict[int,str], question: str) -> Tuple[bool, str, Optional[str]]:
+class CompiledRule(NamedTuple):
+    cond_fn: CondFn                 # antecedent over (fd, index, hay)
+    concl_tokens: FrozenSet[str]    # predicate_tokens of the conclusion
+    derived: Optional[str]          # fact added when the rule fires (None for negative conclusions)
+    is_negative: bool               # conclusion conveys negation
+
+@lru_cache(maxsize=4096)
+def compile_rule(body: str) -> CompiledRule:
+    """
+    Partially evaluate a rule body once: split if/then, compile the condition and
+    precompute everything about the conclusion. Identical bodies across rows share it.
+    """
+    cond, concl = split_if_then(body)
+    is_negative = conclusion_is_negative(concl)
+    # We allow chaining by adding positive conclusions (and neutral ones) as derived facts.
+    derived = None if is_negative else normalize_text(concl)
+    return CompiledRule(compile_condition(cond), predicate_tokens(concl), derived, is_negative)
+
+def rule_applies(rule: CompiledRule, fd: Dict[int,str], index: TokenIndex,
+                 hay: str, tset: FrozenSet[str]) -> Tuple[bool, str, Optional[str]]:
     """
     Determine if a rule antecedent holds under the facts.
+    hay is all_facts_text(fd) and tset the question's predicate tokens.
     Return (applies, effect, derived_fact)
       - applies: True if condition satisfied
       - effect: 'support' or 'block' (only if conclusion matches the question predicate),
@@ -225,84 +363,110 @@ def rule_applies(rule: str, fd: Dict[int,str], question: str) -> Tuple[bool, str
       - derived_fact: normalized conclusion to add into facts if applies and effect is '' or 'support'
                       (we don't add blocking conclusions as facts unless needed for chains)
     """
-    cond, concl = split_if_then(rule)
-    if not evaluate_condition(fd, cond):
+    if not rule.cond_fn(fd, index, hay):
         return (False, "", None)
 
     # If it applies, decide if it directly supports/blocks the question
     eff = ""
-    if predicate_match(concl, question):
-        eff = "block" if conclusion_is_negative(concl) else "support"
+    if predicate_match(rule.concl_tokens, tset):
+        eff = "block" if rule.is_negative else "support"
 
-    # We allow chaining by adding positive conclusions (and neutral ones) as derived facts.
-    derived = None
-    if not conclusion_is_negative(concl):
-        # store a succinct normalized conclusion as a fact line
-        derived = normalize_text(concl)
-
-    return (True, eff, derived)
-
-def answer_from_effects(effects: List[Tuple[str,int]]) -> str:
-    """
-    Given list of (effect, priority) where effect in {'support','block'},
-    decide Proved / Disproved / Unknown using highest-priority outcome.
-    Ties on priority break toward 'block'.
-    """
-    if not effects:
-        return "Unknown"
-    best = max(effects, key=lambda x: (x[1], 1 if x[0]=='support' else 2))
-    return "Proved" if best[0] == 'support' else "Disproved"
+    return (True, eff, rule.derived)
 
 def predict_row(facts: str, rules: str, preferences: str, question: str) -> str:
     fd = facts_dict(facts)
     prio = parse_preferences(preferences)
-    effects: List[Tuple[str,int]] = []
+    # Highest-priority effect so far; ties on priority go to 'block'
+    best_prio, best_eff = -1, ""
 
-    # Split rules into (id, body)
-    rule_items: List[Tuple[str,str]] = []
-    for chunk in re.split(r';\s*', rules or ""):
+    # Split rules into (id, compiled rule)
+    rule_items: List[Tuple[str,CompiledRule]] = []
+    for chunk in (rules or "").split(';'):
         chunk = chunk.strip()
         if not chunk:
             continue
         rid, body = parse_rule(chunk)
-        rule_items.append((rid, body))
+        rule_items.append((rid, compile_rule(body)))
+
+    tset = predicate_tokens(target_predicate_text(question))
+    index = build_index(fd)
+    # Joined facts for phrase scans, extended in place of re-joining per rule
+    hay = all_facts_text(fd)
 
     # Iterative application to allow simple chaining of derived facts
-    seen_derived: Set[str] = set()
+    fact_set: Set[str] = set(fd.values())  # O(1) dedup mirror of fd
+    next_idx = len(fd)  # facts_dict keys are 0..n-1
     changed = True
     max_passes = 5  # small upper bound for safety
     passes = 0
 
-    while changed and passes < max_passes:
+    # A rule that has applied once has already recorded its effect and derived
+    # fact; re-firing it could only repeat them, so it is dropped from later
+    # passes. The loop ends as soon as a pass derives nothing new.
+    pending = rule_items
+    while changed and pending and passes < max_passes:
         passes += 1
         changed = False
-        for rid, body in rule_items:
-            applies, effect, derived = rule_applies(body, fd, question)
+        waiting: List[Tuple[str,CompiledRule]] = []
+        for rid, rule in pending:
+            applies, effect, derived = rule_applies(rule, fd, index, hay, tset)
             if not applies:
+                waiting.append((rid, rule))
                 continue
             # Collect effect if rule conclusion targets the question
-            if effect in ("support","block"):
-                effects.append((effect, prio.get(rid, 0)))
+            if effect:
+                p = prio.get(rid, 0)
+                if p > best_prio or (p == best_prio and effect == "block"):
+                    best_prio, best_eff = p, effect
             # Add derived fact for chaining (only if new)
-            if derived and derived not in fd.values() and derived not in seen_derived:
-                idx = max(fd.keys()) + 1 if fd else 0
-                fd[idx] = derived
-                seen_derived.add(derived)
+            if derived and derived not in fact_set:
+                fd[next_idx] = derived
+                next_idx += 1
+                fact_set.add(derived)
+                index_fact(index, derived)
+                hay = hay + " ; " + derived if len(fd) > 1 else derived
                 changed = True
+        pending = waiting
+
+    if best_eff == "support":
+        return "Proved"
+    return "Disproved" if best_eff == "block" else "Unknown"
+
+# Rows are independent, so large files are spread over a process pool; below
+# this many rows (or on one core) starting the workers costs more than it saves
+POOL_MIN_ROWS = 2000
+POOL_CHUNKSIZE = 64
 
-    return answer_from_effects(effects)
+def predict_rows(args: List[Tuple[str,str,str,str]]) -> List[str]:
+    """
+    predict_row over (facts, rules, preferences, question) tuples, in order.
+    """
+    if len(args) >= POOL_MIN_ROWS and (os.cpu_count() or 1) > 1:
+        with Pool() as pool:
+            return pool.starmap(predict_row, args, chunksize=POOL_CHUNKSIZE)
+    return [predict_row(*a) for a in args]
 
 def eval_csv(path: str) -> float:
     total, correct = 0, 0
+    # Collect report lines and write them once instead of printing per row
+    lines: List[str] = []
+    append = lines.append
     with open(path, newline='') as f:
-        r = csv.DictReader(f)
-        for row in r:
-            pred = predict_row(row['facts'], row['rules'], row['preferences'], row['question'])
-            ok = (pred == row['label'])
-            total += 1; correct += int(ok)
-            print(f"id:{row['id']} predicted: {pred} ({'correct' if ok else 'wrong'})")
-    acc = correct / max(1,total)
-    print(f"Overall Accuracy: {acc:.2f}")
+        r = csv.reader(f)
+        # Resolve column positions once; rows are then plain lists
+        cols = ('id', 'facts', 'rules', 'preferences', 'question', 'label')
+        idx = {name: i for i, name in enumerate(next(r, cols))}
+        ii, fi, ri, pi, qi, li = (idx[k] for k in cols)
+        rows = [row for row in r if row]  # drop blank lines, as DictReader did
+        preds = predict_rows([(row[fi], row[ri], row[pi], row[qi]) for row in rows])
+        for row, pred in zip(rows, preds):
+            ok = (pred == row[li])
+            total += 1
+            correct += ok
+            append(f"id:{row[ii]} predicted: {pred} ({'correct' if ok else 'wrong'})\n")
+    acc = correct / max(1, total)
+    append(f"Overall Accuracy: {acc:.2f}\n")
+    sys.stdout.write(''.join(lines))
     return acc
 
 if __name__ == '__main__':
@@ -0,0 +1,24 @@
+import os
+
+import pytest
+
+import setup_path
+
+from solution import eval_csv as eval_csv_solution
+from solution1 import eval_csv as eval_csv_solution1
+from solution3 import eval_csv as eval_csv_solution3
+
+TASKS = os.path.join(os.path.dirname(__file__), "..", "source", "defeasible_tasks.csv")
+
+@pytest.mark.parametrize("eval_csv", [eval_csv_solution, eval_csv_solution1, eval_csv_solution3])
+def test_eval_csv_skips_blank_lines(eval_csv, tmp_path, capsys):
+    with open(TASKS, newline='') as f:
+        text = f.read()
+    expected = eval_csv(TASKS)
+    report = capsys.readouterr().out
+
+    header, first, rest = text.split("\n", 2)
+    padded = tmp_path / "padded.csv"
+    padded.write_text(f"{header}\n{first}\n\n{rest}\n\n")
+    assert eval_csv(str(padded)) == expected
+    assert capsys.readouterr().out == report
@@ -6,4 +6,16 @@ def test_solve():
     input = 2
     output = 2
     solution = ClimbingStairs()
-    assert solution.solve(input) == output
\ No newline at end of file
+    assert solution.solve(input) == output
+
+def test_solve_large():
+    solution = ClimbingStairs()
+    assert solution.solve(0) == 1
+    assert solution.solve(1) == 1
+    assert solution.solve(10) == 89
+    assert solution.solve(2000) == solution.solve(1999) + solution.solve(1998)
+
+def test_climb_matches_solve():
+    solution = ClimbingStairs()
+    for n in range(30):
+        assert solution.climb(0, n) == solution.solve(n)
@@ -0,0 +1,42 @@
+import random
+import pytest
+
+import setup_path
+
+# the extension is an optional build (source/setup_normalize_fast.py)
+normalize_fast = pytest.importorskip("normalize_fast")
+
+from solution3 import NEG_RE, NUM_RE, PUNCT_TABLE, WORD_RE
+
+TOKENS = ["does", "do", "is", "are", "has", "have", "were", "not", "don't", "doesn't",
+          "can't", "cannot", "won't", "isn't", "frog", "Dog", "$100", "-5", "(dog+lion)",
+          "-", "+", "?", "!", ",", ";", "'", "x's", "a.b", "_", "x-y", "10", "3-4", "--7",
+          "notx", "dox", "Does", "NOT", "\t", "\n", "\x0b", "\x1c", "\x1f", "\x7f", "\x00"]
+
+def random_texts(n, seed=0):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield "".join(rng.choice(TOKENS) + rng.choice(["", " ", " ", "  ", "\t "])
+                      for _ in range(rng.randint(0, 8)))
+
+def reference_normalize(s):
+    return " ".join(NEG_RE.sub("not", s).translate(PUNCT_TABLE).split())
+
+def reference_index_fact(index, fact):
+    m = NUM_RE.search(fact)
+    num = int(m.group(1)) if m else None
+    for tok in set(WORD_RE.findall(fact)):
+        index.setdefault(tok, []).append(num)
+
+def test_normalize_ascii_matches_regex_path():
+    for s in random_texts(20000):
+        s = s.lower()
+        assert normalize_fast.normalize_ascii(s) == reference_normalize(s), repr(s)
+
+def test_index_fact_matches_regex_path():
+    for s in random_texts(20000, seed=1):
+        for fact in (s, reference_normalize(s.lower())):
+            expected, got = {}, {}
+            reference_index_fact(expected, fact)
+            normalize_fast.index_fact(got, fact)
+            assert got == expected, repr(fact)
@@ -0,0 +1,16 @@
+import setup_path
+
+from solution import parse_facts, predict_row, sum_money
+
+FROG_RULE = "R1: if frog > (dog+lion) then frog builds plant"
+
+def test_sum_money_counts_any_amount_mentioning_entity():
+    facts = parse_facts("Frog has $100; frog has 1 coins; Frog has 12 friends; Dog has $30; hotdog has $5")
+    assert sum_money(facts, "frog") == 113
+    assert sum_money(facts, "dog") == 35
+    assert sum_money(facts, "lion") == 0
+
+def test_non_dollar_amounts_feed_frog_rule():
+    assert predict_row("frog has 1 coins; cat has $11", FROG_RULE, "", "Does frog build plant?") == "Proved"
+    assert predict_row("Frog has 12 friends; Dog has $5", FROG_RULE, "", "Does frog build plant?") == "Proved"
+    assert predict_row("Frog has 3 friends; Dog has $5", FROG_RULE, "", "Does frog build plant?") == "Unknown"
@@ -0,0 +1,58 @@
+import pytest
+
+import setup_path
+
+from solution1 import eval_csv, evaluate_condition, parse_facts, predict_row
+
+FACTS = parse_facts("Frog has $100; Dog has $30; Lion has $20; Camel has 11 friends; frog attacks cat")
+
+def test_boolean_fact():
+    assert evaluate_condition("frog attacks cat", FACTS) is True
+    assert evaluate_condition("Frog attacks cat", FACTS) is True
+    assert evaluate_condition("cat guards fields", FACTS) is False
+
+@pytest.mark.parametrize("condition, expected", [
+    (">10 friends", True),
+    ("> 10 friends", True),
+    (">11 friends", False),
+])
+def test_friends_threshold(condition, expected):
+    assert evaluate_condition(condition, FACTS) is expected
+
+@pytest.mark.parametrize("condition, expected", [
+    ("frog > (dog+lion)", True),
+    ("frog < (dog+lion)", False),
+    ("frog - dog > lion", True),
+    ("frog == dog + lion + 50", True),
+    ("frog - (dog + lion) != 50", False),
+    ("frog > -5", True),
+    ("-5 < frog", True),
+    ("-frog < -(dog+lion)", True),
+])
+def test_entity_sums_and_comparisons(condition, expected):
+    assert evaluate_condition(condition, FACTS) is expected
+
+def test_missing_entity_is_false():
+    assert evaluate_condition("frog > (dog+lion)", parse_facts("Frog has $100; Dog has $30")) is False
+
+@pytest.mark.parametrize("condition", [
+    "__import__('os')",
+    "frog*2 > dog",        # arithmetic beyond +/- is deliberately unsupported
+    "frog > dog > lion",   # so are chained comparisons
+    "frog > dog and dog > lion",
+    "frog >",
+    "(frog > dog",
+])
+def test_rejected_input_is_false(condition):
+    assert evaluate_condition(condition, FACTS) is False
+
+def test_friends_threshold_rule_does_not_crash(tmp_path, capsys):
+    # the eval-based version raised ValueError (int('10 friends')) out of eval_csv
+    rule = "R1: if >10 friends then camel smiles"
+    assert predict_row("Camel has 11 friends", rule, "R1", "Does camel smile?") == "Proved"
+    assert predict_row("Camel has 5 friends", rule, "R1", "Does camel smile?") == "Unknown"
+    path = tmp_path / "tasks.csv"
+    path.write_text("id,facts,rules,preferences,question,label\n"
+                    f"1,Camel has 11 friends,{rule},R1,Does camel smile?,Proved\n")
+    assert eval_csv(str(path)) == 1.0
+    assert "id:1 predicted: Proved (correct)" in capsys.readouterr().out